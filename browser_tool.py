@@ -22,13 +22,109 @@ Usage in Agent API sandbox:
 """
 
 import base64
+import collections
 import json
+import os
+import queue
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Optional, Literal, Tuple
+from urllib.parse import urlparse
+from typing import Optional, Literal
 from dataclasses import dataclass
 
 
+# Optional io_uring-backed disk writes (Linux). Falls back to plain
+# os.write in the writer thread when the bindings aren't installed.
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+# Optional compiled same-host filter (see crawl_utils.pyx); worth building
+# for validations in the thousands of pages, where link bookkeeping is a
+# real fraction of CPU. Falls back to the urlparse loop when absent.
+try:
+    from crawl_utils import filter_same_host
+except ImportError:
+    filter_same_host = None
+
+
+class _ScreenshotWriter:
+    """
+    Background writer that persists screenshot bytes off the crawl path.
+
+    The capture thread hands (path, bytes) to a queue and immediately
+    starts the next navigation; a single writer thread drains the queue,
+    submitting writes through io_uring when available so even the writer
+    thread doesn't block per-file.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        # Started eagerly: put() is called from concurrent crawl threads,
+        # and an unsynchronized lazy start could spawn two writer threads
+        # with only one recorded - close() would then join the wrong one
+        # and hang on its single sentinel. An idle writer just blocks on
+        # the queue.
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def put(self, path: str, buf: bytes):
+        """Queue screenshot bytes for writing; returns immediately."""
+        self._queue.put((path, buf))
+
+    def close(self):
+        """Flush pending writes and stop the writer thread."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        ring = None
+        if liburing is not None:
+            ring = liburing.io_uring()
+            liburing.io_uring_queue_init(32, ring, 0)
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                path, buf = item
+                try:
+                    self._write(ring, path, buf)
+                except OSError as e:
+                    print(f"Screenshot write failed for {path}: {e}")
+        finally:
+            if ring is not None:
+                liburing.io_uring_queue_exit(ring)
+
+    @staticmethod
+    def _write(ring, path: str, buf: bytes):
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if ring is not None:
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_write(sqe, fd, buf, len(buf), 0)
+                liburing.io_uring_submit(ring)
+                cqe = liburing.io_uring_cqe()
+                liburing.io_uring_wait_cqe(ring, cqe)
+                # cqe.res is bytes written, or a negated errno on failure
+                res = cqe.res
+                liburing.io_uring_cqe_seen(ring, cqe)
+                if res < 0:
+                    raise OSError(-res, os.strerror(-res), path)
+                if res != len(buf):
+                    raise OSError(f"short write to {path}: {res}/{len(buf)} bytes")
+            else:
+                os.write(fd, buf)
+        finally:
+            os.close(fd)
+
+
 @dataclass
 class BrowserResult:
     """Result from a browser action."""
@@ -53,6 +149,27 @@ class BrowserTool:
     Works in environments without X11 by using Playwright's headless mode.
     """
 
+    # Buffers console.error calls in-page instead of streaming every console
+    # message through a Python callback: on JS-heavy pages that costs one CDP
+    # message + one Python dict per log line. get_console_errors() drains the
+    # buffer in a single evaluate.
+    _CONSOLE_CAPTURE_JS = """
+        (() => {
+            window.__errs__ = [];
+            const orig = console.error;
+            console.error = (...args) => {
+                try {
+                    window.__errs__.push({
+                        type: 'error',
+                        text: args.map(String).join(' '),
+                        location: location.href
+                    });
+                } catch (e) {}
+                return orig.apply(console, args);
+            };
+        })();
+    """
+
     def __init__(
         self,
         width: int = 1280,
@@ -61,6 +178,8 @@ class BrowserTool:
         slow_mo: int = 0,
         use_local_proxy: bool = True,
         local_proxy_port: int = 8888,
+        block_resources: Optional[set] = None,
+        user_data_dir: str = '/tmp/browser_profile',
     ):
         """
         Initialize the browser tool.
@@ -72,6 +191,13 @@ class BrowserTool:
             slow_mo: Slow down operations by this many milliseconds
             use_local_proxy: Use local proxy for JWT auth (required in sandbox)
             local_proxy_port: Port for the local proxy (default 8888)
+            block_resources: Resource types to abort at the network layer
+                (e.g. {'image', 'font', 'media'}). Useful for link-discovery
+                passes where nothing is screenshotted; image and font
+                downloads otherwise dominate page-load time.
+            user_data_dir: Profile directory for the persistent context.
+                Keeping a profile on disk lets Chromium's HTTP cache retain
+                shared CSS/JS/fonts across pages of the same site.
         """
         self.width = width
         self.height = height
@@ -79,20 +205,30 @@ class BrowserTool:
         self.slow_mo = slow_mo
         self.use_local_proxy = use_local_proxy
         self.local_proxy_port = local_proxy_port
+        self.block_resources = block_resources
+        self.user_data_dir = user_data_dir
         self._playwright = None
         self._browser = None
         self._context = None
         self._page = None
+        self._cdp = None
         self._screenshot_dir = Path("/tmp/browser_screenshots")
         self._screenshot_count = 0
         self._console_errors = []
-        self._failed_requests = []
+        # Bounded so a page spewing failures can't grow memory unboundedly
+        self._failed_requests = collections.deque(maxlen=1000)
+        self._local = threading.local()
+        self._writer = _ScreenshotWriter()
+        self._proxy_warmed = False
 
     def _ensure_browser(self):
         """Ensure browser is initialized."""
         if self._page is not None:
             return
 
+        # Deliberately imported lazily: playwright is the one heavy import
+        # in this module, and deferring it keeps CLI startup (--help, arg
+        # errors) instant. urllib et al. are cheap and live at module scope.
         from playwright.sync_api import sync_playwright
 
         self._playwright = sync_playwright().start()
@@ -112,53 +248,144 @@ class BrowserTool:
                 'server': f'http://127.0.0.1:{self.local_proxy_port}'
             }
 
-        self._browser = self._playwright.chromium.launch(
+        # A persistent context keeps Chromium's disk cache between pages,
+        # so sibling pages of the same site don't re-download the shared
+        # CSS/JS/font bundles (big win on design-system-heavy docs sites).
+        self._context = self._playwright.chromium.launch_persistent_context(
+            user_data_dir=self.user_data_dir,
             headless=self.headless,
             args=launch_args,
             proxy=proxy_settings,
-        )
-        self._context = self._browser.new_context(
             viewport={'width': self.width, 'height': self.height},
             ignore_https_errors=True,
         )
-        self._page = self._context.new_page()
-
-        # Track console errors
-        self._page.on('console', lambda msg:
-            self._console_errors.append({
-                'type': msg.type,
-                'text': msg.text,
-                'location': msg.location
-            }) if msg.type == 'error' else None
-        )
+        # None for persistent contexts; kept for the multi-context path
+        self._browser = self._context.browser
+        self._page = self._context.pages[0] if self._context.pages else self._context.new_page()
+
+        # Raw CDP session for fast screenshots (Page.captureScreenshot)
+        self._cdp = self._context.new_cdp_session(self._page)
+
+        self._attach_listeners(self._page)
 
-        # Track failed requests
-        self._page.on('requestfailed', lambda req:
+        self._screenshot_dir.mkdir(parents=True, exist_ok=True)
+
+    def _attach_listeners(self, page):
+        """Install console-error and failed-request trackers on a page."""
+        if self.block_resources:
+            page.route('**/*', lambda r:
+                r.abort() if r.request.resource_type in self.block_resources
+                else r.continue_()
+            )
+
+        page.add_init_script(self._CONSOLE_CAPTURE_JS)
+
+        page.on('requestfailed', lambda req:
             self._failed_requests.append({
                 'url': req.url,
                 'failure': req.failure
             })
         )
 
-        self._screenshot_dir.mkdir(parents=True, exist_ok=True)
+    def new_worker(self):
+        """
+        Create a (context, page, cdp) triple for the calling thread.
+
+        A single Chromium process hosts BrowserContexts far more cheaply than
+        extra browser instances, so concurrent crawl workers each get their
+        own context + page off the shared browser. The triple is bound to the
+        calling thread: subsequent goto()/screenshot()/get_links() calls from
+        that thread operate on the worker's page instead of the main one.
+        Calling this again from the same thread returns the existing triple.
+
+        Note that Playwright's sync API is bound to the thread that started
+        it, so only the thread that first initialized this tool may call in
+        at all - use a BrowserPool (which pins each tool to its own thread)
+        for cross-thread parallelism, not several threads on one tool.
 
-    def goto(self, url: str, wait_until: str = 'networkidle', timeout: int = 30000) -> BrowserResult:
+        Returns:
+            Tuple of (BrowserContext, Page, CDPSession)
+        """
+        self._ensure_browser()
+        worker = getattr(self._local, 'worker', None)
+        if worker is not None:
+            return worker
+
+        if self._browser is not None:
+            context = self._browser.new_context(
+                viewport={'width': self.width, 'height': self.height},
+                ignore_https_errors=True,
+            )
+        else:
+            # Persistent contexts can't mint sibling contexts; workers get
+            # their own page in the shared context instead, which also means
+            # they share its HTTP cache.
+            context = self._context
+        page = context.new_page()
+        self._attach_listeners(page)
+        cdp = context.new_cdp_session(page)
+
+        self._local.worker = (context, page, cdp)
+        return self._local.worker
+
+    def _current_page(self):
+        """Page for the calling thread (worker page if one is bound)."""
+        worker = getattr(self._local, 'worker', None)
+        return worker[1] if worker is not None else self._page
+
+    def _current_cdp(self):
+        """CDP session for the calling thread's page."""
+        worker = getattr(self._local, 'worker', None)
+        return worker[2] if worker is not None else self._cdp
+
+    def _current_host(self):
+        """Host of the calling thread's last navigation (set by goto)."""
+        host = getattr(self._local, 'current_host', None)
+        if host is None:
+            host = urlparse(self._current_page().url).netloc.lower()
+            self._local.current_host = host
+        return host
+
+    def goto(self, url: str, wait_until: str = 'domcontentloaded', timeout: int = 30000,
+             settle_ms: int = 0) -> BrowserResult:
         """
         Navigate to a URL.
 
+        Defaults to 'domcontentloaded': 'networkidle' waits 500ms past the
+        last request plus any analytics/beacon tail, which costs 0.5-2s per
+        page and is rarely needed just to read HTML and take a screenshot.
+        Callers that need the page to settle (e.g. heavy client-side
+        rendering) should pass wait_until='load' plus a settle_ms, like
+        create_mockups.py does.
+
         Args:
             url: The URL to navigate to
             wait_until: Wait condition ('load', 'domcontentloaded', 'networkidle')
             timeout: Timeout in milliseconds
+            settle_ms: Extra fixed wait after navigation, for pages that
+                keep rendering past the wait_until event
 
         Returns:
             BrowserResult with navigation outcome
         """
         self._ensure_browser()
+        page = self._current_page()
+
+        # The first request through the local JWT proxy pays a TCP+TLS
+        # handshake that inflates networkidle timing; once the socket is
+        # warm and keepalive kicks in, 'load' is just as settled.
+        if wait_until == 'networkidle' and self.use_local_proxy and self._proxy_warmed:
+            wait_until = 'load'
+
         try:
-            response = self._page.goto(url, wait_until=wait_until, timeout=timeout)
+            response = page.goto(url, wait_until=wait_until, timeout=timeout)
+            if settle_ms:
+                page.wait_for_timeout(settle_ms)
             status = response.status if response else 0
-            final_url = self._page.url
+            final_url = page.url
+            self._proxy_warmed = True
+            # Memoized so the link filters don't re-parse the page URL
+            self._local.current_host = urlparse(final_url).netloc.lower()
             return BrowserResult(
                 success=True,
                 output=f"Navigated to {final_url} (status: {status})"
@@ -175,6 +402,15 @@ class BrowserTool:
         """
         Take a screenshot of the current page.
 
+        Uses the CDP `Page.captureScreenshot` command directly rather than
+        Playwright's `page.screenshot()`: JPEG with `optimizeForSpeed` roughly
+        halves Chromium's encode time, and the base64 payload comes straight
+        off the wire, so there is no PNG-to-disk-to-base64 round-trip. The
+        image is held in memory exactly once per representation (base64 for
+        the result, decoded bytes for the writer); nothing is read back from
+        disk or re-encoded, which on multi-MB full-page captures keeps peak
+        memory to the file size rather than a multiple of it.
+
         Args:
             path: File path to save screenshot (auto-generated if None)
             full_page: Capture the full scrollable page
@@ -187,9 +423,26 @@ class BrowserTool:
         try:
             if path is None:
                 self._screenshot_count += 1
-                path = str(self._screenshot_dir / f"screenshot_{self._screenshot_count:03d}.png")
-
-            self._page.screenshot(path=path, full_page=full_page)
+                path = str(self._screenshot_dir / f"screenshot_{self._screenshot_count:03d}.jpg")
+
+            try:
+                data = self._current_cdp().send('Page.captureScreenshot', {
+                    'format': 'jpeg',
+                    'quality': 90,
+                    'optimizeForSpeed': True,
+                    'captureBeyondViewport': full_page,
+                })['data']
+            except Exception:
+                # CDP session can detach (e.g. after a crash-recovered page).
+                # Ask Playwright for JPEG bytes directly rather than letting it
+                # write a file we'd have to re-read for the base64 payload.
+                buf = self._current_page().screenshot(full_page=full_page,
+                                                      type='jpeg', quality=90)
+                data = base64.b64encode(buf).decode('ascii')
+
+            # Hand the bytes to the background writer so the caller can
+            # start its next navigation without waiting on disk.
+            self._writer.put(path, base64.b64decode(data))
 
             result = BrowserResult(
                 success=True,
@@ -198,8 +451,7 @@ class BrowserTool:
             )
 
             if return_base64:
-                with open(path, 'rb') as f:
-                    result.screenshot_base64 = base64.b64encode(f.read()).decode()
+                result.screenshot_base64 = data
 
             return result
         except Exception as e:
@@ -228,7 +480,7 @@ class BrowserTool:
         """
         self._ensure_browser()
         try:
-            self._page.mouse.click(x, y, button=button, click_count=click_count, delay=delay)
+            self._current_page().mouse.click(x, y, button=button, click_count=click_count, delay=delay)
             return BrowserResult(
                 success=True,
                 output=f"Clicked at ({x}, {y}) with {button} button"
@@ -249,7 +501,7 @@ class BrowserTool:
         """
         self._ensure_browser()
         try:
-            self._page.keyboard.type(text, delay=delay)
+            self._current_page().keyboard.type(text, delay=delay)
             return BrowserResult(
                 success=True,
                 output=f"Typed {len(text)} characters"
@@ -269,7 +521,7 @@ class BrowserTool:
         """
         self._ensure_browser()
         try:
-            self._page.keyboard.press(key)
+            self._current_page().keyboard.press(key)
             return BrowserResult(
                 success=True,
                 output=f"Pressed key: {key}"
@@ -316,8 +568,23 @@ class BrowserTool:
             elif direction == 'right':
                 delta_x = pixels
 
-            self._page.mouse.wheel(delta_x, delta_y)
-            time.sleep(0.3)  # Let scroll settle
+            page = self._current_page()
+            pre = page.evaluate('() => [window.scrollX, window.scrollY]')
+            page.mouse.wheel(delta_x, delta_y)
+
+            # Return as soon as the viewport has actually moved (or a short
+            # timeout passes, e.g. when already at the page edge) instead of
+            # always sleeping 300ms per scroll.
+            expected = min(abs(delta_x) + abs(delta_y), 50)
+            try:
+                page.wait_for_function(
+                    f'([x0, y0]) => Math.abs(window.scrollX - x0)'
+                    f' + Math.abs(window.scrollY - y0) >= {expected}',
+                    arg=pre,
+                    timeout=500,
+                )
+            except Exception:
+                pass  # Nothing scrolled within the timeout; carry on
 
             return BrowserResult(
                 success=True,
@@ -339,7 +606,7 @@ class BrowserTool:
         """
         self._ensure_browser()
         try:
-            self._page.mouse.move(x, y)
+            self._current_page().mouse.move(x, y)
             return BrowserResult(
                 success=True,
                 output=f"Moved mouse to ({x}, {y})"
@@ -369,12 +636,12 @@ class BrowserTool:
     def get_url(self) -> str:
         """Get the current page URL."""
         self._ensure_browser()
-        return self._page.url
+        return self._current_page().url
 
     def get_title(self) -> str:
         """Get the current page title."""
         self._ensure_browser()
-        return self._page.title()
+        return self._current_page().title()
 
     def get_links(self, same_domain: bool = True) -> list[str]:
         """
@@ -387,32 +654,86 @@ class BrowserTool:
             List of URLs
         """
         self._ensure_browser()
-        from urllib.parse import urlparse
 
-        links = self._page.eval_on_selector_all(
+        # Filter and dedup in the browser: URL() is native there, whereas
+        # Python's urlparse allocates several objects per link, which adds
+        # up on pages with hundreds of anchors. The filtered list crosses
+        # the CDP boundary once.
+        page = self._current_page()
+        host = self._current_host() if same_domain else None
+        return page.eval_on_selector_all(
             'a[href]',
-            'elements => elements.map(e => e.href)'
+            '(els, host) => [...new Set('
+            'els.map(e => e.href)'
+            '.filter(h => !host || new URL(h, location.href).host === host)'
+            ')]',
+            host,
         )
 
-        if same_domain:
-            current_domain = urlparse(self._page.url).netloc
-            links = [
-                link for link in links
-                if urlparse(link).netloc == current_domain
-            ]
+    def get_page_info(self, same_domain: bool = True) -> dict:
+        """
+        Get the current URL, title and links in a single CDP round-trip.
+
+        Cheaper than calling get_url() + get_title() + get_links(), which
+        cost three round-trips and two DOM scans per page.
+
+        Args:
+            same_domain: Only include links on the same domain
+
+        Returns:
+            Dict with 'url', 'title' and 'links' keys
+        """
+        self._ensure_browser()
+        info = self._current_page().evaluate(
+            "() => ({"
+            "url: location.href, "
+            "title: document.title, "
+            "links: Array.from(document.querySelectorAll('a[href]'), e => e.href)"
+            "})"
+        )
 
-        return list(set(links))  # Remove duplicates
+        links = info['links']
+        if same_domain:
+            current_domain = self._current_host()
+            if filter_same_host is not None:
+                links = filter_same_host(links, current_domain.encode())
+            else:
+                links = [
+                    link for link in links
+                    if urlparse(link).netloc == current_domain
+                ]
+        # Dedup in one order-preserving pass so crawl order is reproducible
+        info['links'] = list(dict.fromkeys(links))
+
+        return info
 
     def get_console_errors(self) -> list[dict]:
-        """Get all console errors captured during this session."""
+        """
+        Get all console errors captured during this session.
+
+        Drains the in-page window.__errs__ buffer for the calling thread's
+        current page into the session list first. Errors buffered on a page
+        are lost when it navigates away, so long crawls should drain after
+        each page visit.
+        """
+        if self._page is not None:
+            try:
+                errs = self._current_page().evaluate(
+                    '() => { const e = window.__errs__ || []; window.__errs__ = []; return e; }'
+                )
+                self._console_errors.extend(errs)
+            except Exception:
+                pass  # Page may be mid-navigation; buffered errors are best-effort
         return self._console_errors.copy()
 
     def get_failed_requests(self) -> list[dict]:
         """Get all failed network requests during this session."""
-        return self._failed_requests.copy()
+        return list(self._failed_requests)
 
     def close(self):
         """Close the browser and clean up resources."""
+        self._writer.close()  # Flush queued screenshots to disk first
+        self._cdp = None
         if self._page:
             self._page.close()
             self._page = None
@@ -427,21 +748,133 @@ class BrowserTool:
             self._playwright = None
 
 
-def validate_website(url: str, max_pages: int = 10, screenshot_dir: str = "/tmp/validation/screenshots"):
+class BrowserPool:
+    """
+    A pool of independent BrowserTool instances, one Chromium process each.
+
+    Chromium serializes Page.captureScreenshot across all pages of a single
+    browser instance, so a screenshot-heavy crawl stalls on capture even
+    when navigation runs on many contexts. Spreading workers over a few
+    browser processes lets screenshots encode in true parallel.
+
+    Playwright's sync API is bound to the thread that started it - calling
+    into a tool from any other thread raises a greenlet switch error - so
+    each slot owns a single-thread executor, and every operation on that
+    slot's tool (init, page operations, close) runs on its thread via
+    run(). Slots are handed out exclusively via acquire()/release(); each
+    gets its own profile dir so the persistent contexts don't fight over
+    one profile.
+    """
+
+    def __init__(self, size: int = 2, **browser_kwargs):
+        """
+        Initialize the pool.
+
+        Args:
+            size: Number of Chromium processes (2-4 is usually enough;
+                screenshots serialize per-process, navigation doesn't)
+            **browser_kwargs: Passed through to each BrowserTool
+        """
+        self.size = size
+        self._slots = queue.Queue()
+        self._tools = []
+        self._executors = []
+        for idx in range(size):
+            kwargs = dict(browser_kwargs)
+            kwargs.setdefault('user_data_dir', f'/tmp/browser_profile/worker_{idx}')
+            self._tools.append(BrowserTool(**kwargs))
+            self._executors.append(ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f'browser_{idx}'))
+            self._slots.put(idx)
+
+    def acquire(self) -> int:
+        """Check out a slot index; blocks until one is free."""
+        return self._slots.get()
+
+    def release(self, idx: int):
+        """Return a checked-out slot to the pool."""
+        self._slots.put(idx)
+
+    def run(self, idx: int, fn, *args, **kwargs):
+        """
+        Run fn(tool, *args, **kwargs) on the slot's owning thread.
+
+        Blocks for the result; exceptions propagate to the caller.
+        """
+        return self._executors[idx].submit(
+            fn, self._tools[idx], *args, **kwargs).result()
+
+    def get_console_errors(self) -> list[dict]:
+        """Console errors aggregated across all pool browsers."""
+        errors = []
+        for idx in range(self.size):
+            errors.extend(self.run(idx, BrowserTool.get_console_errors))
+        return errors
+
+    def get_failed_requests(self) -> list[dict]:
+        """Failed requests aggregated across all pool browsers."""
+        failed = []
+        for idx in range(self.size):
+            failed.extend(self.run(idx, BrowserTool.get_failed_requests))
+        return failed
+
+    def close(self):
+        """Close every browser in the pool, each on its owning thread."""
+        for idx in range(self.size):
+            try:
+                self.run(idx, BrowserTool.close)
+            finally:
+                self._executors[idx].shutdown()
+
+
+def _canonicalize_url(u: str) -> str:
+    """
+    Canonical dedup key for a crawl URL: drop the fragment, strip the
+    trailing slash, and lowercase the host, so /foo, /foo/ and /foo#bar
+    all collapse to one key.
+    """
+    parts = urlparse(u)
+    key = f"{parts.scheme}://{parts.netloc.lower()}{parts.path.rstrip('/')}"
+    if parts.query:
+        key += f"?{parts.query}"
+    return key
+
+
+def validate_website(
+    url: str,
+    max_pages: int = 10,
+    screenshot_dir: str = "/tmp/validation/screenshots",
+    max_workers: int = 8,
+    capture_screenshots: bool = True,
+    num_browsers: int = 2,
+):
     """
     Validate a website by visiting pages and taking screenshots.
 
+    Pages are crawled by a pool of dispatch threads. Each visit checks a
+    slot out of a small BrowserPool (screenshots serialize inside one
+    Chromium process, so a couple of processes capture in true parallel)
+    and runs on that slot's pinned browser thread. Per-page time is dominated
+    by network wait, so concurrency gives a near-linear speedup over the
+    old sequential BFS loop.
+
     Args:
         url: Starting URL
         max_pages: Maximum pages to visit
         screenshot_dir: Directory to save screenshots
+        max_workers: Number of concurrent crawl workers
+        capture_screenshots: Take a screenshot of every page. When False
+            the run is link-discovery only, so image/font/media requests
+            are aborted outright, cutting navigation time several-fold.
+        num_browsers: Number of Chromium processes in the pool
 
     Returns:
         Dictionary with validation results
     """
-    from urllib.parse import urlparse
-
-    browser = BrowserTool()
+    pool = BrowserPool(
+        size=num_browsers,
+        block_resources=None if capture_screenshots else {'image', 'font', 'media'},
+    )
     results = {
         "site": url,
         "pages": [],
@@ -452,71 +885,119 @@ def validate_website(url: str, max_pages: int = 10, screenshot_dir: str = "/tmp/
 
     Path(screenshot_dir).mkdir(parents=True, exist_ok=True)
 
+    # Shared crawl state; guarded by `lock` since workers append links.
+    # Both sets hold canonicalized keys so /foo and /foo#x dedup together.
+    lock = threading.Lock()
     visited = set()
-    to_visit = [url]
-    page_num = 0
-
-    try:
-        while to_visit and page_num < max_pages:
-            current_url = to_visit.pop(0)
-            if current_url in visited:
-                continue
-
-            visited.add(current_url)
-            page_num += 1
-
-            print(f"[{page_num}/{max_pages}] Visiting: {current_url}")
-
-            # Navigate
-            nav_result = browser.goto(current_url)
+    to_visit = collections.deque([url])
+    queued = {_canonicalize_url(url)}
 
-            if not nav_result.success:
-                results["issues"].append({
-                    "url": current_url,
-                    "type": "navigation_error",
-                    "severity": "high",
-                    "description": nav_result.error
-                })
-                continue
+    def visit(current_url, page_num):
+        """Visit one URL on a browser checked out of the pool.
 
-            final_url = browser.get_url()
-            title = browser.get_title()
-
-            # Take screenshot
-            screenshot_path = f"{screenshot_dir}/page_{page_num:03d}.png"
+        The actual browser work runs on the slot's owning thread via
+        pool.run(); this dispatch thread just waits for the result.
+        """
+        idx = pool.acquire()
+        try:
+            return pool.run(idx, _visit, current_url, page_num)
+        finally:
+            pool.release(idx)
+
+    def _visit(browser, current_url, page_num):
+        browser.new_worker()
+
+        print(f"[{page_num}/{max_pages}] Visiting: {current_url}")
+
+        # Navigate
+        nav_result = browser.goto(current_url, wait_until='domcontentloaded')
+
+        if not nav_result.success:
+            return {
+                "url": current_url,
+                "type": "navigation_error",
+                "severity": "high",
+                "description": nav_result.error
+            }, None
+
+        info = browser.get_page_info(same_domain=True)
+        final_url = info['url']
+        title = info['title']
+
+        # Take screenshot
+        screenshot_path = None
+        if capture_screenshots:
+            screenshot_path = f"{screenshot_dir}/page_{page_num:03d}.jpg"
             screenshot_result = browser.screenshot(screenshot_path)
+            if not screenshot_result.success:
+                screenshot_path = None
+
+        page_info = {
+            "url": final_url,
+            "title": title,
+            "status": "ok",
+            "screenshot": screenshot_path,
+        }
 
-            # Record page info
-            page_info = {
-                "url": final_url,
-                "title": title,
-                "status": "ok",
-                "screenshot": screenshot_path if screenshot_result.success else None,
-            }
-            results["pages"].append(page_info)
-
-            # Get links for crawling
-            if page_num == 1:
-                # Update domain based on final URL (handle redirects)
-                final_domain = urlparse(final_url).netloc
-                results["final_domain"] = final_domain
+        if page_num == 1:
+            # Update domain based on final URL (handle redirects)
+            results["final_domain"] = urlparse(final_url).netloc
 
-            links = browser.get_links(same_domain=True)
+        links = info['links']
+        with lock:
             for link in links:
-                if link not in visited and link not in to_visit:
+                key = _canonicalize_url(link)
+                if key not in visited and key not in queued:
+                    queued.add(key)
                     to_visit.append(link)
 
-    except Exception as e:
-        results["issues"].append({
-            "url": current_url if 'current_url' in dir() else url,
-            "type": "error",
-            "severity": "high",
-            "description": str(e)
-        })
+        # Drain this page's console-error buffer into the session list now:
+        # the next visit on this slot navigates the same page, destroying
+        # window.__errs__ and anything still buffered there.
+        browser.get_console_errors()
+
+        return None, page_info
+
+    page_num = 0
+    pending = set()
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while True:
+                # Dispatch everything currently queued, up to max_pages.
+                with lock:
+                    while to_visit and page_num < max_pages:
+                        current_url = to_visit.popleft()
+                        key = _canonicalize_url(current_url)
+                        if key in visited:
+                            continue
+                        visited.add(key)
+                        page_num += 1
+                        pending.add(executor.submit(visit, current_url, page_num))
+
+                if not pending:
+                    break
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        issue, page_info = future.result()
+                    except Exception as e:
+                        results["issues"].append({
+                            "url": url,
+                            "type": "error",
+                            "severity": "high",
+                            "description": str(e)
+                        })
+                        continue
+                    if issue:
+                        results["issues"].append(issue)
+                    if page_info:
+                        results["pages"].append(page_info)
     finally:
-        results["console_errors"] = browser.get_console_errors()
-        results["failed_requests"] = browser.get_failed_requests()
-        browser.close()
+        results["console_errors"] = pool.get_console_errors()
+        results["failed_requests"] = pool.get_failed_requests()
+        pool.close()
 
     return results
 
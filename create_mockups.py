@@ -9,35 +9,18 @@ CHROMIUM_PATH = '/root/.cache/ms-playwright/chromium-1194/chrome-linux/chrome'
 LOCAL_PROXY = 'http://127.0.0.1:8888'
 SCREENSHOT_DIR = '/tmp/validation/screenshots'
 
-def create_mockups():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(
-            executable_path=CHROMIUM_PATH,
-            headless=True,
-            args=['--no-sandbox', '--disable-setuid-sandbox', '--disable-dev-shm-usage', '--disable-gpu'],
-            proxy={'server': LOCAL_PROXY}
-        )
-        context = browser.new_context(
-            viewport={'width': 1280, 'height': 800},
-            ignore_https_errors=True,
-        )
-        page = context.new_page()
-
-        # Mockup 1: Home Page - Add prominent CTA and improve hero section
-        print("Creating Mockup 1: Home Page improvements...")
-        page.goto('https://platform.claude.com/docs/en/home', wait_until='load', timeout=60000)
-        page.wait_for_timeout(3000)
+# Mockup 1: Home Page - Add prominent CTA and improve hero section
+MOCKUP_HOME_JS = '''() => {
+            const setStyle = (el, text) => { if (el) el.style.cssText = text; };
+            const h1 = document.querySelector('h1');
+            const searchBox = document.querySelector('input[placeholder*="Ask Claude"]');
+            const cards = document.querySelectorAll('[class*="card"], [class*="Card"]');
+            const sectionHeadings = document.querySelectorAll('h2');
 
-        # Apply UX improvements to home page
-        page.evaluate('''() => {
             // 1. Make the main heading more impactful
-            const h1 = document.querySelector('h1');
-            if (h1) {
-                h1.style.cssText = 'font-size: 3rem; font-weight: 700; margin-bottom: 24px; color: #1a1a1a;';
-            }
+            setStyle(h1, 'font-size: 3rem; font-weight: 700; margin-bottom: 24px; color: #1a1a1a;');
 
             // 2. Add a prominent "Get Started" CTA button
-            const searchBox = document.querySelector('input[placeholder*="Ask Claude"]');
             if (searchBox && searchBox.parentElement) {
                 const ctaContainer = document.createElement('div');
                 ctaContainer.style.cssText = 'display: flex; gap: 16px; justify-content: center; margin: 24px 0;';
@@ -68,41 +51,39 @@ def create_mockups():
             }
 
             // 3. Add visual indicators to card sections
-            const cards = document.querySelectorAll('[class*="card"], [class*="Card"]');
-            cards.forEach((card, i) => {
+            cards.forEach(card => {
                 card.style.transition = 'transform 0.2s, box-shadow 0.2s';
                 card.style.cursor = 'pointer';
             });
 
             // 4. Improve section headings
-            const sectionHeadings = document.querySelectorAll('h2');
             sectionHeadings.forEach(h2 => {
-                h2.style.cssText = 'font-size: 1.75rem; font-weight: 600; margin: 48px 0 24px 0; color: #1a1a1a; border-bottom: 2px solid #f5f5f5; padding-bottom: 12px;';
+                setStyle(h2, 'font-size: 1.75rem; font-weight: 600; margin: 48px 0 24px 0; color: #1a1a1a; border-bottom: 2px solid #f5f5f5; padding-bottom: 12px;');
             });
-        }''')
+        }'''
 
-        page.screenshot(path=f'{SCREENSHOT_DIR}/mockup_home.png', full_page=True)
-        print("  Saved: mockup_home.png")
-
-        # Mockup 2: Get Started Page - Improve code block visibility and steps
-        print("Creating Mockup 2: Get Started page improvements...")
-        page.goto('https://platform.claude.com/docs/en/get-started', wait_until='load', timeout=60000)
-        page.wait_for_timeout(3000)
+# Mockup 2: Get Started Page - Improve code block visibility and steps
+MOCKUP_GETSTARTED_JS = '''() => {
+            const setStyle = (el, text) => { if (el) el.style.cssText = text; };
+            // One DOM scan for every heading level; individual lookups
+            // below filter this array in memory instead of re-querying.
+            const allHeaders = Array.from(document.querySelectorAll('h1, h2, h3, h4'));
+            const h1 = allHeaders.find(h => h.tagName === 'H1');
+            const codeBlocks = document.querySelectorAll('pre');
+            const mainContent = document.querySelector('main') || document.querySelector('article');
 
-        page.evaluate('''() => {
             // 1. Add step numbers with better visibility
-            const steps = document.querySelectorAll('h3, h4');
             let stepNum = 0;
-            steps.forEach(step => {
+            allHeaders.forEach(step => {
+                if (step.tagName !== 'H3' && step.tagName !== 'H4') return;
                 if (step.textContent.includes('Set your') || step.textContent.includes('Make your') || step.textContent.includes('Prerequisites')) {
                     stepNum++;
                 }
             });
 
             // 2. Enhance code blocks
-            const codeBlocks = document.querySelectorAll('pre');
             codeBlocks.forEach(block => {
-                block.style.cssText = `
+                setStyle(block, `
                     background: #1e1e1e;
                     border-radius: 12px;
                     padding: 20px;
@@ -110,7 +91,7 @@ def create_mockups():
                     box-shadow: 0 4px 20px rgba(0,0,0,0.15);
                     overflow-x: auto;
                     position: relative;
-                `;
+                `);
                 // Add copy button indicator
                 const copyHint = document.createElement('div');
                 copyHint.style.cssText = 'position: absolute; top: 10px; right: 10px; background: #3b3b3b; color: #888; padding: 4px 12px; border-radius: 4px; font-size: 12px;';
@@ -120,10 +101,9 @@ def create_mockups():
             });
 
             // 3. Add progress indicator
-            const mainContent = document.querySelector('main') || document.querySelector('article');
             if (mainContent) {
                 const progressBar = document.createElement('div');
-                progressBar.style.cssText = `
+                setStyle(progressBar, `
                     position: fixed;
                     top: 60px;
                     left: 0;
@@ -132,46 +112,41 @@ def create_mockups():
                     background: linear-gradient(90deg, #D97706, #B45309);
                     z-index: 1000;
                     border-radius: 0 2px 2px 0;
-                `;
+                `);
                 document.body.appendChild(progressBar);
             }
 
             // 4. Highlight the Prerequisites section
-            const prereqHeading = Array.from(document.querySelectorAll('h2, h3')).find(h => h.textContent.includes('Prerequisites'));
+            const prereqHeading = allHeaders.find(h =>
+                (h.tagName === 'H2' || h.tagName === 'H3') && h.textContent.includes('Prerequisites'));
             if (prereqHeading) {
-                const prereqSection = prereqHeading.nextElementSibling;
-                if (prereqSection) {
-                    prereqSection.style.cssText = `
-                        background: #FEF3C7;
-                        border-left: 4px solid #D97706;
-                        padding: 16px 20px;
-                        border-radius: 0 8px 8px 0;
-                        margin: 16px 0;
-                    `;
-                }
+                setStyle(prereqHeading.nextElementSibling, `
+                    background: #FEF3C7;
+                    border-left: 4px solid #D97706;
+                    padding: 16px 20px;
+                    border-radius: 0 8px 8px 0;
+                    margin: 16px 0;
+                `);
             }
 
             // 5. Add estimated time
-            const h1 = document.querySelector('h1');
             if (h1) {
                 const timeEstimate = document.createElement('div');
-                timeEstimate.style.cssText = 'display: inline-flex; align-items: center; gap: 6px; background: #f0fdf4; color: #166534; padding: 6px 12px; border-radius: 20px; font-size: 14px; margin-left: 12px;';
+                setStyle(timeEstimate, 'display: inline-flex; align-items: center; gap: 6px; background: #f0fdf4; color: #166534; padding: 6px 12px; border-radius: 20px; font-size: 14px; margin-left: 12px;');
                 timeEstimate.innerHTML = '⏱️ ~5 min read';
                 h1.appendChild(timeEstimate);
             }
-        }''')
+        }'''
 
-        page.screenshot(path=f'{SCREENSHOT_DIR}/mockup_getstarted.png', full_page=True)
-        print("  Saved: mockup_getstarted.png")
-
-        # Mockup 3: Prompt Library - Add filtering and better card hover states
-        print("Creating Mockup 3: Prompt Library improvements...")
-        page.goto('https://platform.claude.com/docs/en/resources/prompt-library/library', wait_until='load', timeout=60000)
-        page.wait_for_timeout(3000)
+# Mockup 3: Prompt Library - Add filtering and better card hover states
+MOCKUP_PROMPTLIBRARY_JS = '''() => {
+            const setStyle = (el, text) => { if (el) el.style.cssText = text; };
+            const header = document.querySelector('h1');
+            const cards = document.querySelectorAll('a[href*="prompt-library"]');
+            const allCards = document.querySelectorAll('[class*="grid"] > div, [class*="Grid"] > div');
+            const searchInput = document.querySelector('input[type="search"], input[placeholder*="Search"]');
 
-        page.evaluate('''() => {
             // 1. Add category filter pills
-            const header = document.querySelector('h1');
             if (header) {
                 const filterContainer = document.createElement('div');
                 filterContainer.style.cssText = 'display: flex; gap: 10px; flex-wrap: wrap; margin: 20px 0 30px 0;';
@@ -195,10 +170,9 @@ def create_mockups():
             }
 
             // 2. Improve card hover states
-            const cards = document.querySelectorAll('a[href*="prompt-library"]');
             cards.forEach(card => {
                 if (card.closest('nav')) return; // Skip nav links
-                card.style.cssText = `
+                setStyle(card, `
                     display: block;
                     padding: 20px;
                     border-radius: 12px;
@@ -206,7 +180,7 @@ def create_mockups():
                     border: 1px solid #e5e5e5;
                     transition: all 0.2s ease;
                     text-decoration: none;
-                `;
+                `);
                 card.onmouseover = () => {
                     card.style.transform = 'translateY(-4px)';
                     card.style.boxShadow = '0 12px 24px rgba(0,0,0,0.1)';
@@ -220,7 +194,6 @@ def create_mockups():
             });
 
             // 3. Add "Popular" badge to some prompts
-            const allCards = document.querySelectorAll('[class*="grid"] > div, [class*="Grid"] > div');
             if (allCards.length > 3) {
                 [0, 2, 5].forEach(idx => {
                     if (allCards[idx]) {
@@ -234,9 +207,8 @@ def create_mockups():
             }
 
             // 4. Improve search box
-            const searchInput = document.querySelector('input[type="search"], input[placeholder*="Search"]');
             if (searchInput) {
-                searchInput.style.cssText = `
+                setStyle(searchInput, `
                     width: 100%;
                     padding: 14px 20px 14px 48px;
                     border: 2px solid #e5e5e5;
@@ -246,21 +218,64 @@ def create_mockups():
                     background-image: url("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='20' height='20' viewBox='0 0 24 24' fill='none' stroke='%23999' stroke-width='2'%3E%3Ccircle cx='11' cy='11' r='8'/%3E%3Cpath d='m21 21-4.35-4.35'/%3E%3C/svg%3E");
                     background-repeat: no-repeat;
                     background-position: 16px center;
-                `;
+                `);
             }
 
             // 5. Add result count
-            const mainHeading = document.querySelector('h1');
-            if (mainHeading) {
+            if (header) {
                 const countBadge = document.createElement('span');
                 countBadge.textContent = '60+ prompts';
-                countBadge.style.cssText = 'font-size: 16px; font-weight: 400; color: #666; margin-left: 16px;';
-                mainHeading.appendChild(countBadge);
+                setStyle(countBadge, 'font-size: 16px; font-weight: 400; color: #666; margin-left: 16px;');
+                header.appendChild(countBadge);
             }
-        }''')
+        }'''
+
 
-        page.screenshot(path=f'{SCREENSHOT_DIR}/mockup_promptlibrary.png', full_page=True)
-        print("  Saved: mockup_promptlibrary.png")
+def _capture_mockup(context, url, mutation_js, screenshot_name):
+    """Render one mockup: navigate with the DOM mutation pre-registered.
+
+    The mutation is installed as an init script wrapped in a
+    DOMContentLoaded listener, so it runs as soon as the document is
+    parsed and overlaps the settle window instead of waiting for the
+    full load + fixed timeout to elapse first. That lets the post-load
+    settle drop from 3s to 1s. A fresh page is used per mockup since
+    init scripts can't be unregistered from a live page.
+    """
+    page = context.new_page()
+    page.add_init_script(
+        f"document.addEventListener('DOMContentLoaded', {mutation_js});"
+    )
+    page.goto(url, wait_until='load', timeout=60000)
+    page.wait_for_timeout(1000)
+    page.screenshot(path=f'{SCREENSHOT_DIR}/{screenshot_name}', full_page=True)
+    page.close()
+    print(f"  Saved: {screenshot_name}")
+
+
+def create_mockups():
+    with sync_playwright() as p:
+        browser = p.chromium.launch(
+            executable_path=CHROMIUM_PATH,
+            headless=True,
+            args=['--no-sandbox', '--disable-setuid-sandbox', '--disable-dev-shm-usage', '--disable-gpu'],
+            proxy={'server': LOCAL_PROXY}
+        )
+        context = browser.new_context(
+            viewport={'width': 1280, 'height': 800},
+            ignore_https_errors=True,
+        )
+
+        print("Creating Mockup 1: Home Page improvements...")
+        _capture_mockup(context, 'https://platform.claude.com/docs/en/home',
+                        MOCKUP_HOME_JS, 'mockup_home.png')
+
+        print("Creating Mockup 2: Get Started page improvements...")
+        _capture_mockup(context, 'https://platform.claude.com/docs/en/get-started',
+                        MOCKUP_GETSTARTED_JS, 'mockup_getstarted.png')
+
+        print("Creating Mockup 3: Prompt Library improvements...")
+        _capture_mockup(context, 'https://platform.claude.com/docs/en/resources/prompt-library/library',
+                        MOCKUP_PROMPTLIBRARY_JS, 'mockup_promptlibrary.png')
 
         browser.close()
         print("\nAll mockups created successfully!")